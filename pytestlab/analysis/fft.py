@@ -1,7 +1,35 @@
 # pytestlab/analysis/fft.py
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, Optional
 
+
+@lru_cache(maxsize=8)
+def _rfft_frequencies(n: int, d: float) -> np.ndarray:
+    """Returns the (read-only, cached) rfft frequency bins for `n` samples spaced `d` apart."""
+    frequencies = np.fft.rfftfreq(n, d=d)
+    frequencies.setflags(write=False)
+    return frequencies
+
+
+# Supported window names and the NumPy functions that build them
+_WINDOW_FUNCTIONS = {
+    'hann': np.hanning,
+    'hamming': np.hamming,
+}
+
+
+@lru_cache(maxsize=8)
+def _window(name: str, n: int) -> np.ndarray:
+    """Returns the (read-only, cached) `name` window of length `n`."""
+    window_function = _WINDOW_FUNCTIONS.get(name)
+    if window_function is None:
+        supported = ", ".join(repr(w) for w in _WINDOW_FUNCTIONS)
+        raise ValueError(f"Unsupported window function: {name}. Supported: {supported}, None.")
+    coefficients = window_function(n)
+    coefficients.setflags(write=False)
+    return coefficients
+
 def compute_fft(
     time_array: np.ndarray, 
     voltage_array: np.ndarray, 
@@ -18,8 +46,16 @@ def compute_fft(
 
     Returns:
         A tuple containing:
-            - frequency_array: NumPy array of frequency bins.
-            - magnitude_array: NumPy array of FFT magnitudes (linear).
+            - frequency_array: NumPy array of the N // 2 + 1 non-negative
+              frequency bins (up to and including Nyquist). The array is
+              shared between calls and read-only; copy it before modifying.
+            - magnitude_array: NumPy array of FFT magnitudes (linear), in
+              float32 for float32 input and float64 otherwise.
+        Both arrays are empty if fewer than two samples are given or the
+        time axis is not strictly increasing.
+
+    Raises:
+        ValueError: If `window` is not a supported window name.
     """
     # Ensure time_array and voltage_array are of the same size
     if not isinstance(time_array, np.ndarray) or not isinstance(voltage_array, np.ndarray):
@@ -35,55 +71,39 @@ def compute_fft(
     if N <= 1: # FFT not meaningful for 0 or 1 sample
             return np.array([]), np.array([])
 
-    # Apply windowing if specified
+    # Determine the sampling interval first, so that a time axis from which no
+    # frequency bins can be derived is rejected before any transform work.
+    # Total duration T = time_array[-1] - time_array[0]
+    # Number of sampling intervals = N - 1
+    # Sampling interval dt = T / (N - 1); rfftfreq takes dt itself, so Fs = 1 / dt is never formed
+    dt = (time_array[-1] - time_array[0]) / (N - 1)
+    if not dt > 0:
+        # Cannot determine Fs (e.g. time_array[-1] == time_array[0], or time_array is not sorted).
+        # Consider requiring Fs as an input for more robustness if time_array properties are not guaranteed.
+        # For now, returning empty as a safe default.
+        return np.array([]), np.array([])
+
+    # Apply windowing if specified. The window itself is cached, so the
+    # windowed copy is the only signal-sized allocation before the transform.
+    # The product keeps the signal's float dtype, so float32 records are
+    # transformed (and returned) in single precision.
     if window:
-        if window == 'hann':
-            voltage_array_windowed = voltage_array * np.hanning(N)
-        elif window == 'hamming':
-            voltage_array_windowed = voltage_array * np.hamming(N)
-        # Add other windows or raise error for unsupported window
-        # elif window is None or window == '': # No window
-        #    voltage_array_windowed = voltage_array
-        else:
-            raise ValueError(f"Unsupported window function: {window}. Supported: 'hann', 'hamming', None.")
+        voltage_array_windowed = np.multiply(
+            voltage_array, _window(window, N),
+            dtype=np.float32 if voltage_array.dtype == np.float32 else np.float64,
+        )
     else: # No window
         voltage_array_windowed = voltage_array
 
-
     # Compute FFT
-    fft_values = np.fft.fft(voltage_array_windowed)
-    # Take only positive frequencies (first N // 2 points)
-    # For real inputs, the FFT is symmetric, so we only need half.
-    fft_magnitudes = np.abs(fft_values)[:N // 2]
-
-    # Compute frequency bins
-    # This requires sampling frequency Fs.
-    # A more robust way if time_array is uniformly spaced:
-    if N > 1 and (time_array[-1] - time_array[0]) > 0:
-            # Total duration T = time_array[-1] - time_array[0]
-            # Number of sampling intervals = N - 1
-            # Sampling interval dt = T / (N - 1)
-            # Sampling frequency Fs = 1 / dt = (N - 1) / T
-            dt = (time_array[-1] - time_array[0]) / (N - 1)
-            if dt <= 0: # Avoid division by zero or negative dt if time_array is not monotonic
-                # This case should ideally be caught by pre-checks or handled by requiring Fs
-                return np.array([]), np.array([]) 
-            Fs = 1 / dt
-    elif N == 1 and time_array.size == 1: # Single point, Fs is undefined, Nyquist is 0
-        # Return empty or a specific representation for a single point "spectrum"
-        # For FFT, typically need >1 points.
-        # Or, if Fs is *known* (e.g. from instrument settings), it could be passed in.
-        # For now, aligning with N<=1 check above.
-        return np.array([]), np.array([])
-    else: # Cannot determine Fs (e.g., N > 1 but time_array[-1] == time_array[0]), or N is too small
-            # Or if time_array is not sorted, (time_array[-1] - time_array[0]) could be non-positive.
-            # Consider requiring Fs as an input for more robustness if time_array properties are not guaranteed.
-            # For now, returning empty as a safe default.
-            return np.array([]), np.array([])
-
+    # For real inputs the spectrum is Hermitian-symmetric, so the real-input
+    # transform computes only the N // 2 + 1 non-negative frequency bins.
+    fft_values = np.fft.rfft(voltage_array_windowed)
+    fft_magnitudes = np.abs(fft_values)
 
-    # d = sampling interval = 1/Fs
-    frequency_array = np.fft.fftfreq(N, d=1/Fs)[:N // 2]
+    # d = sampling interval dt
+    # Consecutive captures almost always share N and dt, so the bins are cached
+    frequency_array = _rfft_frequencies(N, dt)
 
     # fft_magnitudes are linear. User can convert to dB if needed:
     # fft_magnitudes_db = 20 * np.log10(fft_magnitudes)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import time
 import numpy as np
 import polars as pl
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, Self
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Type, Union, Self
 from dataclasses import dataclass
 from PIL import Image
 from io import BytesIO, StringIO
@@ -42,6 +43,19 @@ _ACQ_MODE_MAP = {
     "SEGMENTED": "SEGMented"
 }
 
+# Sample dtypes for the :WAVeform:FORMat transfer types (WORD is read LSB first)
+_WAVEFORM_DTYPES = {"BYTE": np.uint8, "WORD": "<u2"}
+
+# :FFT:VTYPe? response prefix -> magnitude units of the FFT math waveform
+_FFT_VTYPE_UNITS = {
+    "DEC": "dBV",
+    "VRMS": "V",
+}
+
+# Default franalysis_sweep completion timeout: a fixed allowance plus a per-point budget (s)
+_FRA_TIMEOUT_BASE = 10.0
+_FRA_TIMEOUT_PER_POINT = 1.0
+
 class ChannelReadingResult(MeasurementResult):
     """A result class for oscilloscope channel readings (time, voltage, etc)."""
     pass
@@ -217,7 +231,7 @@ class ScopeAcquisitionFacade:
         if acq_type == AcquisitionType.AVERAGE and current_mode_query == _ACQ_MODE_MAP["SEGMENTED"].upper()[:4]:
             raise InstrumentParameterError(parameter="acq_type", value="AVERAGE", message="AVERAGE mode is unavailable in SEGMENTED acquisition.")
         self._scope._send_command(f":ACQuire:TYPE {scpi_val}")
-        self._scope._wait()
+        self._scope._sync()
         self._scope._logger.debug(f"Acquisition TYPE set → {acq_type.name}")
         return self
 
@@ -267,7 +281,7 @@ class ScopeAcquisitionFacade:
                 message=f"Average count can only be set when acquisition type is AVERAGE, not {current_acq_type_str}.",
             )
         self._scope._send_command(f":ACQuire:COUNt {count}")
-        self._scope._wait()
+        self._scope._sync()
         self._scope._logger.debug(f"AVERAGE count set → {count}")
         return self
 
@@ -287,7 +301,7 @@ class ScopeAcquisitionFacade:
         if not scpi_mode_val:
             raise InstrumentParameterError(parameter="mode", value=mode, valid_range=list(_ACQ_MODE_MAP.keys()), message="Unknown acquisition mode.")
         self._scope._send_command(f":ACQuire:MODE {scpi_mode_val}")
-        self._scope._wait()
+        self._scope._sync()
         self._scope._logger.debug(f"Acquisition MODE set → {mode_upper}")
         return self
 
@@ -307,7 +321,7 @@ class ScopeAcquisitionFacade:
             )
         _validate_range(count, 2, 500, "Segmented count")
         self._scope._send_command(f":ACQuire:SEGMented:COUNt {count}")
-        self._scope._wait()
+        self._scope._sync()
         self._scope._logger.debug(f"Segmented COUNT set → {count}")
         return self
 
@@ -325,7 +339,7 @@ class ScopeAcquisitionFacade:
         total_segments: int = self.get_segmented_count()
         _validate_range(index, 1, total_segments, "Segment index")
         self._scope._send_command(f":ACQuire:SEGMented:INDex {index}")
-        self._scope._wait()
+        self._scope._sync()
         self._scope._logger.debug(f"Segment INDEX set → {index}")
         return self
 
@@ -346,7 +360,7 @@ class ScopeAcquisitionFacade:
                 message="Segment analysis requires SEGMENTED mode."
             )
         self._scope._send_command(":ACQuire:SEGMented:ANALyze")
-        self._scope._wait()
+        self._scope._sync()
         return self
 
     @validate_call
@@ -409,6 +423,59 @@ class Preamble:
     yref: float
 
 
+def _scale_waveform(raw: np.ndarray, pre: Preamble, dtype: type[np.floating] = np.float64, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Converts raw ADC codes to Y-axis values using the preamble's scaling.
+
+    `(raw - yref) * yinc + yorg` is folded into `raw * gain + offset` with the
+    constants computed once per call. The codes are promoted to `dtype` once
+    and then scaled in place, so a single output-sized buffer is allocated.
+    If `out` is given, the values are written into it instead and `dtype` is
+    ignored.
+    """
+    gain = pre.yinc
+    offset = pre.yorg - pre.yref * pre.yinc
+    if out is None:
+        out = raw.astype(dtype)
+        np.multiply(out, gain, out=out)
+    else:
+        np.multiply(raw, gain, out=out)
+    np.add(out, offset, out=out)
+    return out
+
+
+def _scale_waveforms(raws: List[np.ndarray], preambles: List[Preamble], dtype: type[np.floating] = np.float64) -> np.ndarray:
+    """Scales equal-length channel records into one preallocated `(channels, points)` array.
+
+    Each row uses its own preamble and is written straight from the raw codes
+    into its slice of the output, so the acquisition allocates a single
+    output-sized buffer and no stacked copy of the raw data.
+    """
+    out = np.empty((len(raws), len(raws[0])), dtype=dtype)
+    for row, raw, pre in zip(out, raws, preambles):
+        _scale_waveform(raw, pre, out=row)
+    return out
+
+
+def _to_dbv(magnitude: np.ndarray) -> None:
+    """Converts linear RMS magnitudes to dBV (20*log10) in place."""
+    # Zero magnitudes map to -inf dBV rather than warning
+    with np.errstate(divide="ignore"):
+        np.log10(magnitude, out=magnitude)
+    magnitude *= 20.0
+
+
+def _waveform_axis(pre: Preamble, n_points: int) -> np.ndarray:
+    """Builds the X axis (time, or frequency for FFT waveforms) for `n_points` samples.
+
+    `(i - xref) * xinc + xorg` is folded into `i * xinc + (xorg - xref * xinc)`
+    and evaluated in place on the index array, so no temporaries are created.
+    """
+    axis = np.arange(n_points, dtype=np.float64)
+    axis *= pre.xinc
+    axis += pre.xorg - pre.xref * pre.xinc
+    return axis
+
+
 class Oscilloscope(Instrument[OscilloscopeConfig]):
     """Drives a digital oscilloscope for waveform acquisition and measurement.
 
@@ -445,6 +512,122 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         # Initialize facades
         self.trigger = ScopeTriggerFacade(self)
         self.acquisition = ScopeAcquisitionFacade(self)
+        # True while inside `deferred_sync()`; setters then skip their *OPC? wait
+        self._defer_sync: bool = False
+
+        # Profile capability lists hoisted into (upper-cased) frozensets so that
+        # parameter validation is a single O(1) membership test per call.
+        fft_config = self.config.fft
+        self._fft_window_types: frozenset[str] = frozenset(wt.upper() for wt in fft_config.window_types) if fft_config else frozenset()
+        self._fft_units: frozenset[str] = frozenset(u.upper() for u in fft_config.units) if fft_config else frozenset()
+        self._trigger_modes: frozenset[str] = frozenset(m.upper() for m in self.config.trigger.modes)
+        self._trigger_slopes: frozenset[str] = frozenset(self.config.trigger.slopes)
+        fra_config = self.config.franalysis
+        self._fra_traces: frozenset[str] = frozenset(t.upper() for t in fra_config.trace) if fra_config else frozenset()
+        self._fra_loads: frozenset[str] = frozenset(ld.upper() for ld in fra_config.load) if fra_config else frozenset()
+        # Last :FFT:VTYPe written by `configure_fft` (None = unknown, query on next read)
+        self._fft_vtype: Optional[str] = None
+        # Valid 1-based channel numbers, checked by `_check_valid_channel`
+        self._valid_channels: frozenset[int] = frozenset(range(1, len(self.config.channels) + 1))
+        # Waveform preambles keyed by (digitized sources, source, transfer format);
+        # cleared by any write that is not part of the waveform read path itself
+        self._preamble_cache: Dict[Tuple[str, str, str], Preamble] = {}
+        # Source list of the last DIGitize (empty = all displayed sources)
+        self._digitized: str = ""
+        # Last :WAVeform:POINts requested by `read_channels` (None = instrument default)
+        self._wave_points: Optional[int] = None
+        # Transfer setup commands last sent by `_read_wave_data` (empty = unknown)
+        self._wave_setup: Tuple[str, ...] = ()
+        # Waveform generator limits as plain (min, max) tuples so the wgen setters
+        # validate with attribute loads instead of walking the profile model.
+        fgen = self.config.function_generator
+        self._fg_freq_range: Tuple[float, float] = (fgen.frequency.min_val, fgen.frequency.max_val) if fgen else (0.0, 0.0)
+        self._fg_amp_range: Tuple[float, float] = (fgen.amplitude.min_val, fgen.amplitude.max_val) if fgen else (0.0, 0.0)
+        self._fg_offset_range: Tuple[float, float] = (fgen.offset.min_val, fgen.offset.max_val) if fgen else (0.0, 0.0)
+        self._has_wgen: bool = fgen is not None
+        self._fg_waveforms: frozenset[str] = frozenset(fgen.waveform_types) if fgen else frozenset()
+
+    @contextlib.contextmanager
+    def deferred_sync(self) -> Iterator[Self]:
+        """Defers the `*OPC?` synchronisation of setters until the block exits.
+
+        Setters such as `set_time_axis` and `set_channel_axis` normally block on
+        `*OPC?` after every call. Inside this context those waits are skipped
+        and a single `*OPC?` is issued when the block exits, so configuring
+        several channels costs one round-trip instead of one per setter:
+
+            with scope.deferred_sync():
+                for ch in (1, 2, 3, 4):
+                    scope.set_channel_axis(ch, scale=0.5, offset=0.0)
+
+        Nested uses are folded into the outermost block. If the block raises,
+        the final wait is skipped and the exception propagates.
+
+        Yields:
+            The `Oscilloscope` instance.
+        """
+        if self._defer_sync:
+            yield self
+            return
+        self._defer_sync = True
+        try:
+            yield self
+        finally:
+            self._defer_sync = False
+        self._wait()
+
+    def reset(self) -> None:
+        """Resets the instrument (*RST) and forgets cached instrument settings."""
+        super().reset()
+        self._fft_vtype = None
+        self._wave_points = None
+        self._wave_setup = ()
+
+    def _send_command(self, command: str, skip_check: bool = False) -> None:
+        """Sends a command, dropping cached waveform state if it may change the acquisition.
+
+        Only the waveform read path's own writes (`:WAVeform:...` selection and
+        `DIGitize`) leave the preamble cache and the last transfer setup intact;
+        every other setting can alter the scaling or record length (and `*RST`
+        the transfer format) and so invalidates both. The sample rate and record
+        length also depend on which sources are digitized, so `DIGitize` records
+        its source list, which is part of the preamble cache key.
+        """
+        if command.startswith("DIGitize"):
+            self._digitized = command[len("DIGitize"):].strip()
+        elif not command.startswith(":WAVeform:"):
+            self._preamble_cache.clear()
+            self._wave_setup = ()
+        super()._send_command(command, skip_check=skip_check)
+
+    def _sync(self) -> None:
+        """Waits for pending commands with `*OPC?` unless inside `deferred_sync()`."""
+        if not self._defer_sync:
+            self._wait()
+
+    def _check_valid_channel(self, channel: int, parameter: str = "channel", message: str = "Channel number is out of range.") -> None:
+        """Raises `InstrumentParameterError` if `channel` is not a configured channel."""
+        if channel not in self._valid_channels:
+            raise InstrumentParameterError(
+                parameter=parameter,
+                value=channel,
+                valid_range=(1, len(self._valid_channels)),
+                message=message,
+            )
+
+    def _check_valid_channels(self, channels: List[int], parameter: str = "channels") -> None:
+        """Raises `InstrumentParameterError` for the first of `channels` that is not configured."""
+        if self._valid_channels.issuperset(channels):
+            return
+        invalid = next(ch for ch in channels if ch not in self._valid_channels)
+        self._check_valid_channel(invalid, parameter=parameter)
+
+    def _check_wgen_available(self) -> None:
+        """Raises `InstrumentConfigurationError` if the profile has no waveform generator."""
+        if not self._has_wgen:
+            raise InstrumentConfigurationError(
+                self.config.model, "Function generator not configured."
+            )
 
     @validate_call
     def channel(self, ch_num: int) -> ScopeChannelFacade:
@@ -462,14 +645,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Raises:
             InstrumentParameterError: If the channel number is invalid.
         """
-        if not self.config.channels or not (1 <= ch_num <= len(self.config.channels)):
-            num_conf_ch = len(self.config.channels) if self.config.channels else 0
-            raise InstrumentParameterError(
-                parameter="ch_num",
-                value=ch_num,
-                valid_range=(1, num_conf_ch),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(ch_num, parameter="ch_num")
         return ScopeChannelFacade(self, ch_num)
 
     @classmethod
@@ -568,57 +744,84 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         """
 
         peram_str: str = self._query(':WAVeform:PREamble?')
-        peram_list: list[str] = peram_str.split(',')
-        self._logger.debug(peram_list)
+        self._logger.debug("Waveform preamble: %s", peram_str)
 
         # Format of preamble:
         # format, type, points, count, xincrement, xorigin, xreference, yincrement, yorigin, yreference
-        pre = Preamble(
-            format=peram_list[0],
-            type=peram_list[1],
-            points=int(peram_list[2]),
-            # peram_list[3] is count, not used directly in Preamble dataclass here
-            xinc=float(peram_list[4]),
-            xorg=float(peram_list[5]),
-            xref=float(peram_list[6]),
-            yinc=float(peram_list[7]),
-            yorg=float(peram_list[8]),
-            yref=float(peram_list[9])
-        )
+        try:
+            fmt, acq_type, points, _count, *scales = peram_str.split(',', 9)
+            if len(scales) != 6:
+                raise ValueError(f"expected 10 preamble fields, got {4 + len(scales)}")
+            # xinc, xorg, xref, yinc, yorg, yref in field order
+            pre = Preamble(fmt, acq_type, int(points), *map(float, scales))
+        except ValueError as e:
+            raise InstrumentDataError(self.config.model, f"Malformed waveform preamble: {peram_str!r}") from e
         return pre
 
-    def _read_wave_data(self, source: str) -> np.ndarray:
+    def _cached_preamble(self, source: str, waveform_format: str = "BYTE") -> Preamble:
+        """Returns the preamble of the currently selected `source`, querying it only once.
+
+        The preamble only changes when the instrument is reconfigured, so it is
+        cached per digitized source set, source and transfer format until the
+        next configuring write (see `_send_command`). Call right after
+        `_read_wave_data(source)`.
+        """
+        key = (self._digitized, source, waveform_format)
+        pre = self._preamble_cache.get(key)
+        if pre is None:
+            pre = self._preamble_cache[key] = self._read_preamble()
+        return pre
+
+    def _read_wave_data(self, source: str, waveform_format: str = "BYTE", points: Optional[int] = None) -> np.ndarray:
         """Reads the raw waveform data block for a given source.
 
-        This internal method configures the waveform transfer format and reads
-        the binary data block from the instrument.
+        This internal method selects the source and waveform transfer format
+        with a single compound write, then reads the binary data block from the
+        instrument. The source stays selected, so `:WAVeform:PREamble?` can be
+        queried afterwards for the same waveform.
+
+        The transfer format is not tied to the source, so it is only sent when
+        it differs from the last one sent; in steady-state loops, and for every
+        channel after the first, the write just switches the source. Any other
+        configuring write (see `_send_command`) forces the next read to resend it.
 
         Args:
             source: The waveform source to read (e.g., "CHANnel1", "FFT").
+            waveform_format: "BYTE" for 8-bit samples or "WORD" for 16-bit
+                             samples (sent LSB first).
+            points: Number of points to transfer, sent with the format.
+                    None keeps the instrument's current setting.
 
         Returns:
             A NumPy array of the raw, unprocessed ADC values.
         """
-        # Ensure previous operations are complete
-        self._wait()
-        self._send_command(f':WAVeform:SOURce {source}')
-        self._wait()
-        self._logger.debug(f"Reading data from {source}")
-
-        # Set the data transfer format to 8-bit bytes
-        self._send_command(':WAVeform:FORMat BYTE')
+        self._logger.debug("Reading data from %s", source)
 
-        # For time-domain channels, ensure we get all raw data points
+        # Transfer format, plus all raw data points for time-domain channels
+        transfer = [f':WAVeform:FORMat {waveform_format}']
+        if waveform_format == "WORD":
+            transfer.append(':WAVeform:BYTeorder LSBFirst')
         if source != "FFT":
-            self._send_command(':WAVeform:POINts:MODE RAW')
-
-        self._logger.debug('Reading points')
+            transfer.append(':WAVeform:POINts:MODE RAW')
+            if points is not None:
+                transfer.append(f':WAVeform:POINts {points}')
+
+        # Select the source and, if it changed, the transfer in one compound message
+        setup = [f':WAVeform:SOURce {source}']
+        if tuple(transfer) != self._wave_setup:
+            setup.extend(transfer)
+            if points is not None and points != self._wave_points:
+                # A new record length changes the preamble of every source
+                self._preamble_cache.clear()
+                self._wave_points = points
+        self._send_commands(setup)
+        self._wave_setup = tuple(transfer)
+        # One *OPC? covers both the setup and any pending acquisition (DIGitize)
         self._wait()
-        self._logger.debug('Reading data')
 
         # Query for the waveform data, which returns a binary block
         raw_data: bytes = self._query_raw(':WAVeform:DATA?')
-        data: np.ndarray = self._read_to_np(raw_data)
+        data: np.ndarray = self._read_to_np(raw_data, dtype=_WAVEFORM_DTYPES[waveform_format])
         return data
 
     @validate_call
@@ -653,9 +856,8 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         :param position: The position of the time axis from the trigger in seconds
         """
 
-        self._send_command(f':TIMebase:SCALe {scale}')
-        self._send_command(f':TIMebase:POSition {position}')
-        self._wait()
+        self._send_commands([f':TIMebase:SCALe {scale}', f':TIMebase:POSition {position}'])
+        self._sync()
 
     @validate_call
     def get_time_axis(self) -> List[float]:
@@ -677,17 +879,10 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         :param scale: The scale of the channel axis in volts
         :param offset: The offset of the channel in volts
         """
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
 
-        self._send_command(f':CHANnel{channel}:SCALe {scale}')
-        self._send_command(f':CHANnel{channel}:OFFSet {offset}')
-        self._wait()
+        self._send_commands([f':CHANnel{channel}:SCALe {scale}', f':CHANnel{channel}:OFFSet {offset}'])
+        self._sync()
 
     @validate_call
     def get_channel_axis(self, channel: int) -> List[float]:
@@ -697,13 +892,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         :param channel: The channel to get the axis for
         :return: A list containing the channel axis scale and offset
         """
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
 
         scale_str: str = self._query(f":CHANnel{channel}:SCALe?")
         offset_str: str = self._query(f":CHANnel{channel}:OFFSet?")
@@ -722,13 +911,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         :param mode: The trigger mode. Default is 'EDGE'
         """
 
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Primary channel number is out of range.",
-            )
+        self._check_valid_channel(channel, message="Primary channel number is out of range.")
 
         actual_source: str
         if source is None:
@@ -737,26 +920,17 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             actual_source = source.upper()
             # Check if source is a channel (handle CH1, CHAN1, CHANNEL1 formats)
             if actual_source.startswith("CH"):
-                try:
-                    num_str = "".join(filter(str.isdigit, actual_source))
-                    if not num_str:
-                        raise ValueError("No digits found in channel source string")
-                    source_channel_to_validate = int(num_str)
-                    if not (1 <= source_channel_to_validate <= len(self.config.channels)):
-                        raise InstrumentParameterError(
-                            parameter="source",
-                            value=source,
-                            valid_range=(1, len(self.config.channels)),
-                            message="Source channel number is out of range.",
-                        )
-                    # Normalize the channel source to CHANNEL format for SCPI command
-                    actual_source = f"CHANnel{source_channel_to_validate}"
-                except (ValueError, IndexError) as e:
+                num_str = "".join(filter(str.isdigit, actual_source))
+                if not num_str:
                     raise InstrumentParameterError(
                         parameter="source",
                         value=source,
                         message="Invalid channel format in source.",
-                    ) from e
+                    )
+                source_channel_to_validate = int(num_str)
+                self._check_valid_channel(source_channel_to_validate, parameter="source", message="Source channel number is out of range.")
+                # Normalize the channel source to CHANNEL format for SCPI command
+                actual_source = f"CHANnel{source_channel_to_validate}"
             elif actual_source not in ["EXTERNAL", "LINE", "WGEN"]:
                 raise InstrumentParameterError(
                     parameter="source",
@@ -765,10 +939,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
                     message="Invalid source.",
                 )
 
-        self._send_command(f':TRIG:SOUR {actual_source}')
-        self._send_command(f':TRIGger:LEVel {level}, CHANnel{channel}')
-
-        if slope.value not in self.config.trigger.slopes:
+        if slope.value not in self._trigger_slopes:
             raise InstrumentParameterError(
                 parameter="slope",
                 value=slope.value,
@@ -777,13 +948,18 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             )
         scpi_slope = slope.value
 
-        if mode.upper() not in [m.upper() for m in self.config.trigger.modes]: # Case-insensitive check
+        if mode.upper() not in self._trigger_modes: # Case-insensitive check
              self._logger.warning(f"Trigger mode '{mode}' not in configured supported modes: {self.config.trigger.modes}. Passing directly to instrument.")
         scpi_mode = mode
 
-        self._send_command(f':TRIGger:SLOPe {scpi_slope}')
-        self._send_command(f':TRIGger:MODE {scpi_mode}')
-        self._wait()
+        # Every argument is validated above, so the trigger is never left half-configured
+        self._send_commands([
+            f':TRIG:SOUR {actual_source}',
+            f':TRIGger:LEVel {level}, CHANnel{channel}',
+            f':TRIGger:SLOPe {scpi_slope}',
+            f':TRIGger:MODE {scpi_mode}',
+        ])
+        self._sync()
 
         self._logger.debug(f"""Trigger set with the following parameters:
                   Trigger Source: {actual_source}
@@ -802,13 +978,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Returns:
         MeasurementResult: An object containing the peak-to-peak voltage measurement.
         """
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
 
         response_str: str = self._query(f"MEAS:VPP? CHAN{channel}")
         reading: float = float(response_str)
@@ -817,19 +987,19 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
 
         if self.config.measurement_accuracy:
             mode_key = f"vpp_ch{channel}"
-            self._logger.debug(f"Attempting to find accuracy spec for Vpp on channel {channel} with key: '{mode_key}'")
+            self._logger.debug("Attempting to find accuracy spec for Vpp on channel %s with key: '%s'", channel, mode_key)
             spec = self.config.measurement_accuracy.get(mode_key)
             if spec:
                 sigma = spec.calculate_std_dev(reading, range_value=None)
                 if sigma > 0:
                     value_to_return = ufloat(reading, sigma)
-                    self._logger.debug(f"Applied accuracy spec '{mode_key}', value: {value_to_return}")
+                    self._logger.debug("Applied accuracy spec '%s', value: %s", mode_key, value_to_return)
                 else:
-                    self._logger.debug(f"Accuracy spec '{mode_key}' resulted in sigma=0. Returning float.")
+                    self._logger.debug("Accuracy spec '%s' resulted in sigma=0. Returning float.", mode_key)
             else:
-                self._logger.debug(f"No accuracy spec found for Vpp on channel {channel} with key '{mode_key}'. Returning float.")
+                self._logger.debug("No accuracy spec found for Vpp on channel %s with key '%s'. Returning float.", channel, mode_key)
         else:
-            self._logger.debug(f"No measurement_accuracy configuration in instrument for Vpp on channel {channel}. Returning float.")
+            self._logger.debug("No measurement_accuracy configuration in instrument for Vpp on channel %s. Returning float.", channel)
 
         measurement_result = MeasurementResult(
             values=value_to_return,
@@ -838,7 +1008,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             measurement_type="P2PV"
         )
 
-        self._logger.debug(f"Peak to Peak Voltage (Channel {channel}): {value_to_return}")
+        self._logger.debug("Peak to Peak Voltage (Channel %s): %s", channel, value_to_return)
 
         return measurement_result
 
@@ -853,13 +1023,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Returns:
         MeasurementResult: An object containing the RMS voltage measurement.
         """
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
 
         response_str: str = self._query(f"MEAS:VRMS? CHAN{channel}")
         reading: float = float(response_str)
@@ -868,21 +1032,21 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
 
         if self.config.measurement_accuracy:
             mode_key = f"vrms_ch{channel}"
-            self._logger.debug(f"Attempting to find accuracy spec for Vrms on channel {channel} with key: '{mode_key}'")
+            self._logger.debug("Attempting to find accuracy spec for Vrms on channel %s with key: '%s'", channel, mode_key)
             spec = self.config.measurement_accuracy.get(mode_key)
             if spec:
                 sigma = spec.calculate_std_dev(reading, range_value=None)
                 if sigma > 0:
                     value_to_return = ufloat(reading, sigma)
-                    self._logger.debug(f"Applied accuracy spec '{mode_key}', value: {value_to_return}")
+                    self._logger.debug("Applied accuracy spec '%s', value: %s", mode_key, value_to_return)
                 else:
-                    self._logger.debug(f"Accuracy spec '{mode_key}' resulted in sigma=0. Returning float.")
+                    self._logger.debug("Accuracy spec '%s' resulted in sigma=0. Returning float.", mode_key)
             else:
-                self._logger.debug(f"No accuracy spec found for Vrms on channel {channel} with key '{mode_key}'. Returning float.")
+                self._logger.debug("No accuracy spec found for Vrms on channel %s with key '%s'. Returning float.", channel, mode_key)
         else:
-            self._logger.debug(f"No measurement_accuracy configuration in instrument for Vrms on channel {channel}. Returning float.")
+            self._logger.debug("No measurement_accuracy configuration in instrument for Vrms on channel %s. Returning float.", channel)
 
-        self._logger.debug(f"RMS Voltage (Channel {channel}): {value_to_return}")
+        self._logger.debug("RMS Voltage (Channel %s): %s", channel, value_to_return)
 
         measurement_result = MeasurementResult(
             values=value_to_return,
@@ -900,15 +1064,33 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         points: Optional[int] = None,
         run_after: bool = True,
         timebase: Optional[float] = None,
+        dtype: Literal["float64", "float32"] = "float64",
+        waveform_format: Literal["BYTE", "WORD"] = "BYTE",
         **kwargs
     ) -> ChannelReadingResult:
         """
         Acquire one or more channels and return a ChannelReadingResult with a correct
         per-channel Y scaling.
 
-        This implementation queries a fresh waveform preamble **for every channel**
+        This implementation uses a separate waveform preamble **for every channel**
         so that Y-axis scaling (yinc/yorg/yref) is applied correctly even when the
-        channels have different vertical settings.
+        channels have different vertical settings. Preambles are cached between
+        calls and re-queried after any configuring write, so repeated reads at
+        fixed settings skip the `:WAVeform:PREamble?` round trips. Settings
+        changed on the front panel are not seen until the next such write.
+
+        `dtype="float32"` stores the voltage columns at half the memory of the
+        default float64. Its 24-bit mantissa resolves every 8-bit (BYTE) or
+        16-bit (WORD) sample code, so none of the instrument's resolution is
+        lost. The time column is always float64.
+
+        `waveform_format="WORD"` transfers 16-bit samples instead, which keeps
+        the extra vertical resolution of high-resolution or averaging modes at
+        twice the bytes on the wire.
+
+        `points` sets `:WAVeform:POINts` in the same compound setup write as
+        the source and format; when omitted the instrument's current record
+        length is transferred.
         """
         # ---------------------- argument normalisation (unchanged) ----------------------
         if 'runAfter' in kwargs:
@@ -927,13 +1109,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         if not all(isinstance(ch, int) for ch in processed_channels):
             raise InstrumentParameterError(message="Channel numbers must be integers.")
 
-        for ch in processed_channels:
-            if not (1 <= ch <= len(self.config.channels)):
-                raise InstrumentParameterError(
-                    parameter="channels", value=ch,
-                    valid_range=(1, len(self.config.channels)),
-                    message="Channel number is out of range.",
-                )
+        self._check_valid_channels(processed_channels)
 
         # -------------------- optional time-base tweak (unchanged) ---------------------
         if timebase is not None:
@@ -946,31 +1122,27 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
 
         sampling_rate = float(self.get_sampling_rate())
 
-        time_array: Optional[np.ndarray] = None
-        columns: dict[str, np.ndarray] = {}
-
-        for idx, ch in enumerate(processed_channels, start=1):
-            # Select channel as waveform source and fetch its preamble
-            self._send_command(f":WAVeform:SOURce CHANnel{ch}")
-            pre = self._read_preamble()
-
-            # Always keep the instrument in BYTE, RAW mode for consistency
-            self._send_command(":WAVeform:FORMat BYTE")
-            self._send_command(":WAVeform:POINts:MODE RAW")
-
-            raw = self._read_wave_data(f"CHANnel{ch}")
+        raws: list[np.ndarray] = []
+        preambles: list[Preamble] = []
+        for ch in processed_channels:
+            # The transfer format is channel-independent, so at most the first
+            # write carries it and later channels only switch source. The
+            # preamble is then read (or reused) for the source that is still selected.
+            raws.append(self._read_wave_data(f"CHANnel{ch}", waveform_format=waveform_format, points=points))
+            preambles.append(self._cached_preamble(f"CHANnel{ch}", waveform_format))
 
-            # Convert Y-axis using **this channel’s** preamble
-            volts = (raw - pre.yref) * pre.yinc + pre.yorg
-            columns[f"Channel {ch} (V)"] = volts
+        if len({len(raw) for raw in raws}) != 1:
+            raise InstrumentDataError(
+                self.config.model,
+                f"Channels returned different record lengths: {[len(raw) for raw in raws]}.",
+            )
 
-            # Only need to compute the common time axis once
-            if time_array is None:
-                n_pts = len(volts)
-                time_array = (np.arange(n_pts) - pre.xref) * pre.xinc + pre.xorg
+        # Convert every channel with **its own** preamble in one vectorised pass
+        volts = _scale_waveforms(raws, preambles, np.float32 if dtype == "float32" else np.float64)
+        columns = {f"Channel {ch} (V)": row for ch, row in zip(processed_channels, volts)}
 
-        if time_array is None:
-            raise InstrumentDataError(self.config.model, "Time axis generation failed.")
+        # The time axis is common to all channels
+        time_array = _waveform_axis(preambles[0], volts.shape[1])
 
         return ChannelReadingResult(
             instrument=self.config.model,
@@ -1002,13 +1174,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Returns:
             str: The probe attenuation value (e.g., '10:1', '1:1').
         """
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
         response_str: str = (self._query(f"CHANnel{channel}:PROBe?")).strip()
         # Assuming response is the numeric factor (e.g., "10", "1")
         try:
@@ -1030,13 +1196,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             channel (int): The oscilloscope channel to set the scale for.
             scale (int): The probe scale value (e.g., 10 for 10:1, 1 for 1:1).
         """
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
 
         channel_model_config = self.config.channels[channel - 1]
         if scale not in channel_model_config.probe_attenuation: # probe_attenuation is List[int]
@@ -1088,13 +1248,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             channel (int): The channel number.
             bandwidth (Union[str, float]): The bandwidth limit (e.g., "20M", 20e6, or "FULL").
         """
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
         self._send_command(f"CHANnel{channel}:BANDwidth {bandwidth}")
 
     @validate_call
@@ -1106,6 +1260,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Args:
         state (bool): True to enable ('ON'), False to disable ('OFF').
         """
+        self._check_wgen_available()
         scpi_state = SCPIOnOff.ON.value if state else SCPIOnOff.OFF.value
         self._send_command(f"WGEN:OUTP {scpi_state}")
 
@@ -1118,21 +1273,21 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Args:
         func_type (WaveformType): The desired function enum member.
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
+        self._check_wgen_available()
+
+        self._send_command(self._wgen_function_command(func_type))
 
+    def _wgen_function_command(self, func_type: WaveformType) -> str:
+        """Validates `func_type` against the profile and returns its `:WGEN:FUNCtion` command."""
         # Check if the SCPI value of the enum is in the list of supported waveform types from config
-        if func_type.value not in self.config.function_generator.waveform_types:
+        if func_type.value not in self._fg_waveforms:
             raise InstrumentParameterError(
                 parameter="func_type",
                 value=func_type.value,
                 valid_range=self.config.function_generator.waveform_types,
                 message="Unsupported waveform type.",
             )
-
-        self._send_command(f"WGEN:FUNC {func_type.value}")
+        return f":WGEN:FUNCtion {func_type.value}"
 
     @validate_call
     ##@ConfigRequires("function_generator")
@@ -1143,12 +1298,8 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Args:
         freq (float): The desired frequency for the waveform generator in Hz.
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
-        # Assuming RangeMixin's assert_in_range is preferred for validation
-        self.config.function_generator.frequency.assert_in_range(freq, name="Waveform generator frequency")
+        self._check_wgen_available()
+        _validate_range(freq, *self._fg_freq_range, "Waveform generator frequency")
         self._send_command(f"WGEN:FREQ {freq}")
 
     @validate_call
@@ -1160,11 +1311,8 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Args:
         amp (float): The desired amplitude for the waveform generator in volts.
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
-        self.config.function_generator.amplitude.assert_in_range(amp, name="Waveform generator amplitude")
+        self._check_wgen_available()
+        _validate_range(amp, *self._fg_amp_range, "Waveform generator amplitude")
         self._send_command(f"WGEN:VOLT {amp}")
 
     @validate_call
@@ -1176,11 +1324,8 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         Args:
         offset (float): The desired voltage offset for the waveform generator in volts.
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
-        self.config.function_generator.offset.assert_in_range(offset, name="Waveform generator offset")
+        self._check_wgen_available()
+        _validate_range(offset, *self._fg_offset_range, "Waveform generator offset")
         self._send_command(f"WGEN:VOLT:OFFSet {offset}")
 
     @validate_call
@@ -1192,14 +1337,16 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         :param offset: The offset of the sine wave in volts
         :param freq: The frequency of the sine wave in Hz.
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
-        self.set_wave_gen_func(WaveformType.SINE)
-        self.set_wave_gen_amp(amp)
-        self.set_wave_gen_offset(offset)
-        self.set_wave_gen_freq(freq)
+        self._check_wgen_available()
+        _validate_range(amp, *self._fg_amp_range, "Waveform generator amplitude")
+        _validate_range(offset, *self._fg_offset_range, "Waveform generator offset")
+        _validate_range(freq, *self._fg_freq_range, "Waveform generator frequency")
+        self._send_commands([
+            self._wgen_function_command(WaveformType.SINE),
+            f":WGEN:VOLTage {amp}",
+            f":WGEN:VOLTage:OFFSet {offset}",
+            f":WGEN:FREQuency {freq}",
+        ])
 
 
     @validate_call
@@ -1223,20 +1370,20 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         if duty_cycle is None:
             duty_cycle = 50
 
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
+        self._check_wgen_available()
 
-        self.set_wave_gen_func(WaveformType.SQUARE)
+        _validate_range(freq, *self._fg_freq_range, "Waveform generator frequency")
 
         def clamp_duty(number: int) -> int:
             return max(1, min(number, 99))
 
-        self._send_command(f':WGEN:VOLTage:LOW {v0}')
-        self._send_command(f':WGEN:VOLTage:HIGH {v1}')
-        self._send_command(f':WGEN:FREQuency {freq}')
-        self._send_command(f':WGEN:FUNCtion:SQUare:DCYCle {clamp_duty(duty_cycle)}')
+        self._send_commands([
+            self._wgen_function_command(WaveformType.SQUARE),
+            f':WGEN:VOLTage:LOW {v0}',
+            f':WGEN:VOLTage:HIGH {v1}',
+            f':WGEN:FREQuency {freq}',
+            f':WGEN:FUNCtion:SQUare:DCYCle {clamp_duty(duty_cycle)}',
+        ])
 
 
     @validate_call
@@ -1249,18 +1396,19 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         :param freq: The frequency of the ramp wave in Hz.
         :param symmetry: Symmetry (0% to 100%).
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
-        self.set_wave_gen_func(WaveformType.RAMP)
+        self._check_wgen_available()
+        _validate_range(freq, *self._fg_freq_range, "Waveform generator frequency")
+
         def clamp_symmetry(number: int) -> int:
             return max(0, min(number, 100))
 
-        self._send_command(f':WGEN:VOLTage:LOW {v0}')
-        self._send_command(f':WGEN:VOLTage:HIGH {v1}')
-        self._send_command(f':WGEN:FREQuency {freq}')
-        self._send_command(f':WGEN:FUNCtion:RAMP:SYMMetry {clamp_symmetry(symmetry)}')
+        self._send_commands([
+            self._wgen_function_command(WaveformType.RAMP),
+            f':WGEN:VOLTage:LOW {v0}',
+            f':WGEN:VOLTage:HIGH {v1}',
+            f':WGEN:FREQuency {freq}',
+            f':WGEN:FUNCtion:RAMP:SYMMetry {clamp_symmetry(symmetry)}',
+        ])
 
 
     @validate_call
@@ -1284,16 +1432,21 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         if pulse_width is None:
             raise InstrumentParameterError(message="pulse_width is required.")
 
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
+        self._check_wgen_available()
+        if period <= 0:
+            raise InstrumentParameterError(
+                parameter="period",
+                value=period,
+                message="Waveform generator period must be positive.",
             )
-        self.set_wave_gen_func(WaveformType.PULSE)
-
-        self._send_command(f':WGEN:VOLTage:LOW {v0}')
-        self._send_command(f':WGEN:VOLTage:HIGH {v1}')
-        self._send_command(f':WGEN:PERiod {period}')
-        self._send_command(f':WGEN:FUNCtion:PULSe:WIDTh {pulse_width}')
+        _validate_range(1.0 / period, *self._fg_freq_range, "Waveform generator frequency")
+        self._send_commands([
+            self._wgen_function_command(WaveformType.PULSE),
+            f':WGEN:VOLTage:LOW {v0}',
+            f':WGEN:VOLTage:HIGH {v1}',
+            f':WGEN:PERiod {period}',
+            f':WGEN:FUNCtion:PULSe:WIDTh {pulse_width}',
+        ])
 
 
     @validate_call
@@ -1303,12 +1456,12 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
 
         :param offset: The offset of the DC wave in volts
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
-        self.set_wave_gen_func(WaveformType.DC)
-        self.set_wave_gen_offset(offset)
+        self._check_wgen_available()
+        _validate_range(offset, *self._fg_offset_range, "Waveform generator offset")
+        self._send_commands([
+            self._wgen_function_command(WaveformType.DC),
+            f":WGEN:VOLTage:OFFSet {offset}",
+        ])
 
 
     @validate_call
@@ -1320,14 +1473,14 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         :param v1: The 'high' amplitude component or similar parameter for noise.
         :param offset: The offset of the noise wave in volts.
         """
-        if self.config.function_generator is None:
-            raise InstrumentConfigurationError(
-                self.config.model, "Function generator not configured."
-            )
-        self.set_wave_gen_func(WaveformType.NOISE)
-        self._send_command(f':WGEN:VOLTage:LOW {v0}')
-        self._send_command(f':WGEN:VOLTage:HIGH {v1}')
-        self.set_wave_gen_offset(offset)
+        self._check_wgen_available()
+        _validate_range(offset, *self._fg_offset_range, "Waveform generator offset")
+        self._send_commands([
+            self._wgen_function_command(WaveformType.NOISE),
+            f':WGEN:VOLTage:LOW {v0}',
+            f':WGEN:VOLTage:HIGH {v1}',
+            f":WGEN:VOLTage:OFFSet {offset}",
+        ])
 
     @validate_call
     def display_channel(self, channels: Union[int, List[int]], state: bool = True) -> None:
@@ -1349,16 +1502,12 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
                 message="channels must be an int or a list of ints"
             )
 
+        # Validate every channel before sending anything, so an invalid entry
+        # cannot leave the display partially updated
+        self._check_valid_channels(ch_list)
+
         scpi_state = SCPIOnOff.ON.value if state else SCPIOnOff.OFF.value
-        for ch_num in ch_list:
-            if not (1 <= ch_num <= len(self.config.channels)):
-                raise InstrumentParameterError(
-                    parameter="channels",
-                    value=ch_num,
-                    valid_range=(1, len(self.config.channels)),
-                    message="Channel number is out of range.",
-                )
-            self._send_command(f"CHANnel{ch_num}:DISPlay {scpi_state}")
+        self._send_commands([f":CHANnel{ch_num}:DISPlay {scpi_state}" for ch_num in ch_list])
 
     @validate_call
     #@ConfigRequires("fft")
@@ -1402,17 +1551,11 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             raise InstrumentConfigurationError(
                 self.config.model, "FFT not configured for this instrument."
             )
-        if not (1 <= source_channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="source_channel",
-                value=source_channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Source channel number is out of range.",
-            )
+        self._check_valid_channel(source_channel, parameter="source_channel", message="Source channel number is out of range.")
 
         # Validate window_type against config.fft.window_types (List[str])
         # Assuming window_type parameter is the SCPI string itself
-        if window_type.upper() not in [wt.upper() for wt in self.config.fft.window_types]:
+        if window_type.upper() not in self._fft_window_types:
             raise InstrumentParameterError(
                 parameter="window_type",
                 value=window_type,
@@ -1422,7 +1565,7 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
         scpi_window = window_type
 
         # Validate units against config.fft.units (List[str])
-        if units.upper() not in [u.upper() for u in self.config.fft.units]:
+        if units.upper() not in self._fft_units:
             raise InstrumentParameterError(
                 parameter="units",
                 value=units,
@@ -1431,54 +1574,23 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             )
         scpi_units = units
 
-        self._send_command(f':FFT:SOURce1 CHANnel{source_channel}')
-        self._send_command(f':FFT:WINDow {scpi_window}')
-
+        # The whole FFT setup goes out as one compound message
+        commands = [f':FFT:SOURce1 CHANnel{source_channel}', f':FFT:WINDow {scpi_window}']
         if span is not None:
-            self._send_command(f':FFT:SPAn {span}')
-
-        self._send_command(f':FFT:VTYPe {scpi_units}')
-
+            commands.append(f':FFT:SPAn {span}')
+        commands.append(f':FFT:VTYPe {scpi_units}')
         if scale is not None:
-            self._send_command(f':FFT:SCALe {scale}')
-
+            commands.append(f':FFT:SCALe {scale}')
         if offset is not None:
-            self._send_command(f':FFT:OFFSet {offset}')
-
-        scpi_display_state = SCPIOnOff.ON.value if display else SCPIOnOff.OFF.value
-        self._send_command(f':FFT:DISPlay {scpi_display_state}')
+            commands.append(f':FFT:OFFSet {offset}')
+        commands.append(f':FFT:DISPlay {SCPIOnOff.ON.value if display else SCPIOnOff.OFF.value}')
+        self._send_commands(commands)
+        self._fft_vtype = scpi_units
 
         self._logger.debug(f"FFT configured for channel {source_channel}.")
 
-    def _convert_binary_block_to_data(self, binary_block: bytes) -> np.ndarray: # Synchronous method for converting binary data
-        """
-        Converts a SCPI binary block to a NumPy array.
-        Assumes format like #<N><LengthBytes><DataBytes>
-        This method's original implementation was problematic.
-        This is a more standard interpretation of SCPI binary blocks.
-        The actual data type (e.g., int8, int16) depends on :WAVeform:FORMat.
-        """
-        if not binary_block.startswith(b'#'):
-            raise InstrumentDataError(
-                self.config.model, "Invalid binary block format: does not start with #"
-            )
-
-        len_digits = int(binary_block[1:2].decode('ascii'))
-        data_len = int(binary_block[2 : 2 + len_digits].decode('ascii'))
-
-        actual_data_start_index = 2 + len_digits
-        raw_data_bytes = binary_block[actual_data_start_index : actual_data_start_index + data_len]
-
-        dt = np.dtype(np.int8)
-        data_array = np.frombuffer(raw_data_bytes, dtype=dt)
-
-        if len(data_array) != data_len:
-             self._logger.debug(f"Warning: Binary block data length mismatch. Expected {data_len}, got {len(data_array)}")
-
-        return data_array
-
     @validate_call
-    def read_fft_data(self, channel: int, window: Optional[str] = 'hann') -> FFTResult:
+    def read_fft_data(self, channel: int, window: Optional[str] = 'hann', dtype: Literal["float64", "float32"] = "float64") -> FFTResult:
         """
         Acquires time-domain data for the specified channel and computes the FFT using
         the analysis submodule.
@@ -1487,22 +1599,19 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             channel (int): The channel number to perform FFT on.
             window (Optional[str]): The windowing function to apply before FFT
                                      (e.g., 'hann', 'hamming', None).
+            dtype: Precision of the acquired voltages and of the magnitude
+                   column. "float32" halves the memory of both and is ample
+                   for the scope's 8-bit samples; frequencies stay float64.
 
         Returns:
             FFTResult: An object containing the computed FFT data (frequency and linear magnitude).
         """
         self._logger.debug(f"Initiating FFT computation for channel {channel} using analysis module.")
 
-        if not (1 <= channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="channel",
-                value=channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Channel number is out of range.",
-            )
+        self._check_valid_channel(channel)
 
         # 1. Acquire raw time-domain waveform data
-        waveform_data: ChannelReadingResult = self.read_channels(channel)
+        waveform_data: ChannelReadingResult = self.read_channels(channel, dtype=dtype)
 
         if waveform_data.values is None or waveform_data.values.is_empty():
             self._logger.warning(f"No waveform data acquired for channel {channel}. Cannot compute FFT.")
@@ -1544,6 +1653,143 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
             })
         )
 
+    @validate_call
+    #@ConfigRequires("fft")
+    def read_fft(self, as_array: bool = False, dtype: Literal["float64", "float32"] = "float64", as_db: bool = False) -> Union[FFTResult, np.ndarray]:
+        """
+        Reads the FFT math waveform computed by the oscilloscope.
+
+        Unlike `read_fft_data`, which transfers the time-domain record and
+        computes the spectrum on the host, this fetches the spectrum the
+        instrument has already computed (see `configure_fft`). Frequencies and
+        magnitudes are both derived from the FFT waveform's preamble in one
+        vectorised pass each, so no host-side transform is needed.
+
+        Args:
+            as_array: If True, skip building the result object and return a
+                      `(N, 2)` float64 array of `[frequency, magnitude]` rows.
+                      Magnitudes are scaled straight into their column; the
+                      frequency axis is built once and copied into the other.
+            dtype: Storage type of the magnitude column. The scope sends 8-bit
+                   codes, so "float32" halves the column's memory without
+                   losing resolution. The frequency axis and the `as_array`
+                   output are always float64.
+            as_db: If True and the scope reports linear magnitudes (VRMS),
+                   convert them to dBV (20*log10) in one in-place pass. This
+                   applies to the `as_array` output as well. Magnitudes
+                   already in dBV are returned unchanged.
+
+        Returns:
+            FFTResult: An object containing the frequency and magnitude columns.
+                       Magnitude units follow the instrument's `:FFT:VTYPe`
+                       setting ("dBV" for DECibel, "V" for VRMS). The setting
+                       is remembered from `configure_fft`; if it was changed
+                       from the front panel, call `reset` or `configure_fft`.
+            np.ndarray: The `(N, 2)` spectrum array when `as_array` is True.
+        """
+        if self.config.fft is None:
+            raise InstrumentConfigurationError(
+                self.config.model, "FFT not configured for this instrument."
+            )
+
+        raw = self._read_wave_data("FFT")
+        # The waveform source is still FFT, so the preamble describes the spectrum:
+        # X is frequency (xinc = bin width) and Y is magnitude.
+        pre = self._cached_preamble("FFT")
+
+        if as_array:
+            spectrum = np.empty((len(raw), 2), dtype=np.float64)
+            spectrum[:, 0] = _waveform_axis(pre, len(raw))
+            _scale_waveform(raw, pre, out=spectrum[:, 1])
+            if as_db and self._fft_magnitude_units() == "V":
+                _to_dbv(spectrum[:, 1])
+            return spectrum
+
+        units = self._fft_magnitude_units()
+        magnitude = _scale_waveform(raw, pre, np.float32 if dtype == "float32" else np.float64)
+        if as_db and units == "V":
+            _to_dbv(magnitude)
+            units = "dBV"
+
+        return FFTResult(
+            instrument=self.config.model,
+            units=units,
+            measurement_type="FFT",
+            values=pl.DataFrame({
+                "Frequency (Hz)": _waveform_axis(pre, len(raw)),
+                f"Magnitude ({units})": magnitude,
+            })
+        )
+
+    @validate_call
+    def read_fft_batch(self, n_traces: int, dtype: Literal["float64", "float32"] = "float64") -> FFTResult:
+        """
+        Captures `n_traces` FFT waveforms and scales them together.
+
+        Each trace comes from its own acquisition: a `DIGitize`, synchronised
+        with `*OPC?`, followed by a `:WAVeform:DATA?` transfer. The
+        source/format setup and the preamble are exchanged once. All traces
+        are then scaled in one vectorised pass over a `(n_traces, N)` block
+        and share one frequency column. Like `read_channels`, this leaves the
+        acquisition stopped.
+
+        Args:
+            n_traces: Number of FFT waveforms to read (at least 1).
+            dtype: Storage type of the magnitude columns (see `read_fft`).
+
+        Returns:
+            FFTResult: "Frequency (Hz)" followed by one "Trace <i> (<units>)"
+                       magnitude column per trace, numbered from 1.
+        """
+        if self.config.fft is None:
+            raise InstrumentConfigurationError(
+                self.config.model, "FFT not configured for this instrument."
+            )
+        if n_traces < 1:
+            raise InstrumentParameterError(
+                parameter="n_traces",
+                value=n_traces,
+                message="At least one FFT trace must be read.",
+            )
+
+        waveform_format = "BYTE"
+        self._send_command("DIGitize")
+        raws = [self._read_wave_data("FFT", waveform_format)]
+        pre = self._cached_preamble("FFT", waveform_format)
+        for _ in range(n_traces - 1):
+            self._send_command("DIGitize")
+            self._wait()
+            raw_data = self._query_raw(':WAVeform:DATA?')
+            raws.append(self._read_to_np(raw_data, dtype=_WAVEFORM_DTYPES[waveform_format]))
+
+        if len({len(raw) for raw in raws}) != 1:
+            raise InstrumentDataError(
+                self.config.model,
+                f"FFT traces returned different record lengths: {[len(raw) for raw in raws]}.",
+            )
+
+        units = self._fft_magnitude_units()
+        magnitudes = _scale_waveforms(raws, [pre] * n_traces, np.float32 if dtype == "float32" else np.float64)
+        return FFTResult(
+            instrument=self.config.model,
+            units=units,
+            measurement_type="FFT",
+            values=pl.DataFrame({
+                "Frequency (Hz)": _waveform_axis(pre, magnitudes.shape[1]),
+                **{f"Trace {i} ({units})": row for i, row in enumerate(magnitudes, start=1)},
+            })
+        )
+
+    def _fft_magnitude_units(self) -> str:
+        """Returns the FFT magnitude units, querying `:FFT:VTYPe?` only if not yet known."""
+        if self._fft_vtype is None:
+            self._fft_vtype = self._query(":FFT:VTYPe?").strip()
+        vtype = self._fft_vtype
+        return next(
+            (u for prefix, u in _FFT_VTYPE_UNITS.items() if vtype.upper().startswith(prefix)),
+            vtype,
+        )
+
     @validate_call
     def screenshot(self) -> Image.Image:
         """
@@ -1558,43 +1804,41 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
                 self.config.model, "Invalid screenshot data format: does not start with #"
             )
 
-        length_of_length_field: int = int(chr(binary_data_response[1]))
-        png_data_length_str: str = binary_data_response[2 : 2 + length_of_length_field].decode('ascii')
-        png_data_length: int = int(png_data_length_str)
-        png_data_start_index: int = 2 + length_of_length_field
-        image_data_bytes: bytes = binary_data_response[png_data_start_index : png_data_start_index + png_data_length]
+        # The shared block parser reads the definite-length header in place and
+        # returns a zero-copy view of the PNG payload (raising if it is truncated)
+        image_data: np.ndarray = self._read_to_np(binary_data_response)
 
-        return Image.open(BytesIO(image_data_bytes))
+        return Image.open(BytesIO(image_data))
 
     @validate_call
     #@ConfigRequires("franalysis")
     #@ConfigRequires("function_generator")
-    def franalysis_sweep(self, input_channel: int, output_channel: int, start_freq: float, stop_freq: float, amplitude: float, points: int = 10, trace: str = "none", load: str = "onemeg", disable_on_complete: bool = True) -> FRanalysisResult:
+    def franalysis_sweep(self, input_channel: int, output_channel: int, start_freq: float, stop_freq: float, amplitude: float, points: int = 10, trace: str = "none", load: str = "onemeg", disable_on_complete: bool = True, timeout: Optional[float] = None) -> FRanalysisResult:
         """
         Perform a frequency response analysis sweep.
 
+        Args:
+            disable_on_complete: Disable the analysis afterwards, also when the
+                                 sweep fails or times out.
+            timeout: Seconds to wait for the sweep to complete. Defaults to
+                     `_FRA_TIMEOUT_BASE` (10 s) plus `_FRA_TIMEOUT_PER_POINT`
+                     (1 s) per sweep point.
+
         Returns:
             FRanalysisResult: Containing the frequency response analysis data.
+
+        Raises:
+            InstrumentCommunicationError: If the sweep does not complete within `timeout`.
         """
-        if self.config.function_generator is None or self.config.franalysis is None:
+        if not self._has_wgen or self.config.franalysis is None:
             raise InstrumentConfigurationError(
                 self.config.model, "Function generator or FRANalysis not configured."
             )
 
-        if not (1 <= input_channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="input_channel",
-                value=input_channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Input channel is out of range.",
-            )
-        if not (1 <= output_channel <= len(self.config.channels)):
-            raise InstrumentParameterError(
-                parameter="output_channel",
-                value=output_channel,
-                valid_range=(1, len(self.config.channels)),
-                message="Output channel is out of range.",
-            )
+        # Validate everything up front with explicit raises (never `assert`, which
+        # `python -O` strips), so a bad sweep is rejected before any I/O.
+        self._check_valid_channel(input_channel, parameter="input_channel", message="Input channel is out of range.")
+        self._check_valid_channel(output_channel, parameter="output_channel", message="Output channel is out of range.")
 
         # Ensure points is at least 2 for a valid sweep
         if points < 2:
@@ -1604,40 +1848,79 @@ class Oscilloscope(Instrument[OscilloscopeConfig]):
                 valid_range=(2, "inf"),
                 message="Points for sweep must be at least 2.",
             )
+        sweep_points = self.config.franalysis.sweep_points
+        _validate_range(points, sweep_points.min_val, sweep_points.max_val, "points")
+        _validate_range(start_freq, *self._fg_freq_range, "start_freq")
+        _validate_range(stop_freq, *self._fg_freq_range, "stop_freq")
+        if not start_freq < stop_freq:
+            raise InstrumentParameterError(
+                parameter="stop_freq",
+                value=stop_freq,
+                valid_range=(start_freq, self._fg_freq_range[1]),
+                message="stop_freq must be greater than start_freq.",
+            )
+        _validate_range(amplitude, *self._fg_amp_range, "amplitude")
+        if trace.upper() not in self._fra_traces:
+            raise InstrumentParameterError(
+                parameter="trace",
+                value=trace,
+                valid_range=self.config.franalysis.trace,
+                message="Unsupported FRA trace.",
+            )
+        if load.upper() not in self._fra_loads:
+            raise InstrumentParameterError(
+                parameter="load",
+                value=load,
+                valid_range=self.config.franalysis.load,
+                message="Unsupported FRA load.",
+            )
 
-        # SCPI commands for frequency response analysis sweep
-        self._send_command(f":FUNCtion:FRANalysis")
-        self._send_command(f":FREQuency:START {start_freq}")
-        self._send_command(f":FREQuency:STOP {stop_freq}")
-        self._send_command(f":AMPLitude {amplitude}")
-        self._send_command(f":POINTS {points}")
-        self._send_command(f":TRACe:FEED {trace}")
-        self._send_command(f":LOAD {load}")
-
-        if disable_on_complete:
-            self._send_command(":DISABLE")
-
-        # Optionally wait for completion or check status
-        self._wait()  # Ensure to wait for the command to complete
-
-        # Assuming the result can be fetched with a common query, adjust as necessary
-        result_data = self._query(":FETCH:FRANalysis?")
-
-        # Parse the result data into a structured format if needed
-        # For now, let's assume it's a simple comma-separated value string
-        parsed_results = [float(val) for val in result_data.split(',')]
-
-        # Create a DataFrame or structured result object
-        # Assuming two columns: Frequency and Magnitude
-        freq_values = parsed_results[0::2]  # Extracting frequency values
-        mag_values = parsed_results[1::2]   # Extracting magnitude values
+        # Configure the analysis in one compound message
+        self._send_commands([
+            ":FRANalysis:ENABle 1",
+            f":FRANalysis:SOURce:INPut CHANnel{input_channel}",
+            f":FRANalysis:SOURce:OUTPut CHANnel{output_channel}",
+            ":FRANalysis:FREQuency:MODE SWEep",
+            f":FRANalysis:SWEep:POINts {points}",
+            f":FRANalysis:FREQuency:STARt {start_freq}",
+            f":FRANalysis:FREQuency:STOP {stop_freq}",
+            f":FRANalysis:WGEN:VOLTage {amplitude}",
+            f":FRANalysis:WGEN:LOAD {load}",
+            f":FRANalysis:TRACe {trace}",
+        ])
+
+        # A sweep can outlast the I/O timeout, so instead of blocking on *OPC? arm
+        # the operation-complete event right behind RUN and poll *ESR? with
+        # backoff. Reading the register first clears any stale event bits.
+        if timeout is None:
+            timeout = _FRA_TIMEOUT_BASE + _FRA_TIMEOUT_PER_POINT * points
+        self._query("*ESR?")
+        try:
+            self._send_commands([":FRANalysis:RUN", "*OPC"])
+            self._wait_event(timeout=timeout)
+
+            # The analysis results come back as CSV text with a header row, one row
+            # per sweep point (frequency, amplitude, gain, phase), wrapped in an
+            # IEEE 488.2 block on real instruments. Read it as raw bytes so it is
+            # never decoded to str.
+            result_data = self._query_raw(":FRANalysis:DATA?")
+        finally:
+            # Disable the analysis once its results have been fetched, and also
+            # when the sweep fails or times out
+            if disable_on_complete:
+                self._send_command(":FRANalysis:ENABle 0")
+
+        csv_data = self._read_to_np(result_data).tobytes() if result_data.startswith(b"#") else result_data
+        if not csv_data.strip():
+            raise InstrumentDataError(self.config.model, "Frequency response analysis returned no data.")
+        # Every column is numeric, so declare the schema from the header row
+        # and let polars parse in a single pass without type inference
+        header = csv_data.split(b"\n", 1)[0].rstrip(b"\r").decode()
+        values = pl.read_csv(csv_data, schema=dict.fromkeys(header.split(","), pl.Float64))
 
         return FRanalysisResult(
             instrument=self.config.model,
             units="",
             measurement_type="FrequencyResponse",
-            values=pl.DataFrame({
-                "Frequency (Hz)": freq_values,
-                "Magnitude": mag_values
-            })
+            values=values,
         )
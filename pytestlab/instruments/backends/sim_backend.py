@@ -217,6 +217,26 @@ def _merge_dict(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
 # Regex pattern cache – compile once, reuse
 ###############################################################################
 
+def _split_message_units(cmd: str) -> List[str]:
+    """Split a compound SCPI message on ``;`` separators outside quoted strings."""
+    if ";" not in cmd:
+        return [cmd]
+    units: List[str] = []
+    start = 0
+    quote: Optional[str] = None
+    for i, ch in enumerate(cmd):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == ";":
+            units.append(cmd[start:i])
+            start = i + 1
+    units.append(cmd[start:])
+    return [u for u in units if u.strip()] or [cmd]
+
+
 class _PatternRule:
     __slots__ = ("pattern", "template", "actions")
 
@@ -282,15 +302,22 @@ class SimBackend:  # implements AsyncInstrumentIO
         logger.debug("%s: disconnect()", self.model)
 
     def write(self, cmd: str) -> None:
-        "Handle a SCPI write."
+        "Handle a SCPI write (``;``-joined compound messages are supported)."
         logger.debug("%s WRITE ‹%s›", self.model, cmd.strip())
-        self._handle_command(cmd)
+        for unit in _split_message_units(cmd):
+            self._handle_command(unit)
 
     def query(self, cmd: str, delay: float | None = None) -> str:
         "Handle a SCPI query and return a **decoded** string."
         if delay:
             time.sleep(delay)
-        response = self._handle_command(cmd, expect_response=True)
+        units = _split_message_units(cmd)
+        if len(units) == 1:
+            response = self._handle_command(units[0], expect_response=True)
+        else:
+            # IEEE 488.2: responses of a compound query are joined with ';'
+            responses = [self._handle_command(u, expect_response=True) for u in units]
+            response = ";".join(str(r) for r in responses if r != "")
         logger.debug("%s QUERY ‹%s› → %s", self.model, cmd.strip(), response)
         return response
 
@@ -4,6 +4,7 @@ from .._log import get_logger
 from typing import Optional, Tuple, Any, Callable, Type, List as TypingList, Dict, Protocol, TypeVar, Generic
 from abc import abstractmethod
 import numpy as np
+import numpy.typing as npt
 # polars.List is a DataType, not for type hinting Python lists.
 # from polars import List
 from ..errors import InstrumentConnectionError, InstrumentCommunicationError, InstrumentConfigurationError, InstrumentDataError
@@ -181,7 +182,7 @@ class Instrument(Generic[ConfigType]):
                 instrument=logger_name, message=f"Failed to connect backend: {e}"
             ) from e
 
-    def _read_to_np(self, data: bytes) -> np.ndarray:
+    def _read_to_np(self, data: bytes, dtype: npt.DTypeLike = np.uint8) -> np.ndarray:
         """Parses SCPI binary block data into a NumPy array.
 
         This utility method decodes the standard SCPI binary block format, which
@@ -192,22 +193,33 @@ class Instrument(Generic[ConfigType]):
         Args:
             data: The raw bytes received from the instrument, expected to be in
                   SCPI binary block format.
+            dtype: Element type of the payload, including byte order for
+                   multi-byte types (e.g. `"<u2"` for LSB-first 16-bit words).
+                   Defaults to unsigned bytes.
 
         Returns:
             A NumPy array containing the parsed data.
 
         Raises:
-            InstrumentDataError: If the data is not in the expected format.
+            InstrumentDataError: If the data is not in the expected format, or
+                its length is not a whole number of `dtype` elements.
         """
         # The first character must be '#' to indicate a binary block.
         if not data.startswith(b'#'):
-            self._logger.debug(f"Warning: Data for _read_to_np does not start with '#'. Attempting direct conversion. Raw data (first 20 bytes): {data[:20]}")
+            self._logger.debug("Warning: Data for _read_to_np does not start with '#'. Attempting direct conversion. Raw data (first 20 bytes): %r", data[:20])
             # Fallback for non-standard data, which might be a simple header-less stream.
             # This is a best-effort attempt and may not work for all instruments.
+            item_dtype = np.dtype(dtype)
             if len(data) > 10:
                 end_slice = -1 if data.endswith(b'\n') else None
-                return np.frombuffer(data[10:end_slice], dtype=np.uint8)
-            return np.array([], dtype=np.uint8)
+                payload = data[10:end_slice]
+                if len(payload) % item_dtype.itemsize:
+                    raise InstrumentDataError(
+                        self.config.model,
+                        f"Headerless data of {len(payload)} bytes is not a whole number of {item_dtype} samples.",
+                    )
+                return np.frombuffer(payload, dtype=item_dtype)
+            return np.array([], dtype=item_dtype)
 
         try:
             len_digits_char = data[1:2].decode('ascii')
@@ -228,18 +240,28 @@ class Instrument(Generic[ConfigType]):
             actual_data_length = int(data_length_str)
 
             data_start_index = 2 + num_digits_for_length
-            waveform_bytes_segment = data[data_start_index : data_start_index + actual_data_length]
-
-            # Data type (e.g., np.uint8, np.int16, np.float32) should ideally be determined
-            # by the instrument's :WAVeform:FORMat setting. Defaulting to uint8.
-            np_array = np.frombuffer(waveform_bytes_segment, dtype=np.uint8)
-
-            if len(waveform_bytes_segment) != actual_data_length:
-                self._logger.debug(f"Warning: SCPI binary block data length mismatch. Expected {actual_data_length} bytes, got {len(waveform_bytes_segment)} bytes in segment.")
+            available = len(data) - data_start_index
+            if available < actual_data_length:
+                raise InstrumentDataError(
+                    self.config.model,
+                    f"Truncated SCPI binary block: expected {actual_data_length} bytes, got {max(available, 0)}.",
+                )
 
-            return np_array
+            # The element type follows the instrument's transfer format (the caller
+            # passes it in); the array is a read-only view into `data` (no copy).
+            item_dtype = np.dtype(dtype)
+            if actual_data_length % item_dtype.itemsize:
+                raise InstrumentDataError(
+                    self.config.model,
+                    f"SCPI binary block of {actual_data_length} bytes is not a whole number of {item_dtype} samples.",
+                )
+            return np.frombuffer(
+                data, dtype=item_dtype, count=actual_data_length // item_dtype.itemsize, offset=data_start_index
+            )
+        except InstrumentDataError:
+            raise
         except Exception as e:
-            self._logger.debug(f"Error parsing SCPI binary block in _read_to_np: {e}. Raw data (first 50 bytes): {data[:50]}")
+            self._logger.debug("Error parsing SCPI binary block in _read_to_np: %s. Raw data (first 50 bytes): %r", e, data[:50])
             raise InstrumentDataError(
                 self.config.model, "Failed to parse binary data from instrument."
             ) from e
@@ -272,6 +294,25 @@ class Instrument(Generic[ConfigType]):
                 message=f"Failed to send command: {e}",
             ) from e
 
+    def _send_commands(self, commands: TypingList[str], skip_check: bool = False) -> None:
+        """Sends several commands as a single `;`-joined compound message.
+
+        Every command must use a full, colon-rooted header (e.g.
+        `:WAVeform:FORMat BYTE`) so that it is parsed independently of the
+        previous one. The whole batch costs one write and, unless skipped, one
+        error-queue check instead of one of each per command.
+
+        Args:
+            commands: The SCPI commands to send, in order.
+            skip_check: If True, the instrument's error queue will not be checked
+                        after sending the batch.
+
+        Raises:
+            InstrumentCommunicationError: If writing the batch to the backend fails.
+        """
+        if commands:
+            self._send_command(";".join(commands), skip_check=skip_check)
+
     def _query(self, query: str, delay: Optional[float] = None, skip_check: bool = False) -> str:
         """Sends a query to the instrument and returns a string response.
 
@@ -366,32 +407,48 @@ class Instrument(Generic[ConfigType]):
                 message="Failed to wait for operation complete.",
             ) from e
 
-    def _wait_event(self) -> None:
+    def _wait_event(self, initial_interval: float = 0.01, max_interval: float = 0.5, timeout: float = 10.0) -> None:
         """
-        Blocks by polling the Standard Event Status Register (*ESR?) until a non-zero value.
-        This is a basic implementation; specific event setup (*ESE) might be needed.
+        Blocks by polling the Standard Event Status Register (*ESR?) until the OPC bit is set.
+
+        Unlike `_wait`, no single query has to outlast the operation, so this is
+        suited to long operations (e.g. sweeps) that may exceed the I/O timeout.
+        The poll interval starts at `initial_interval` and doubles up to
+        `max_interval`, so short operations return quickly without busy-polling
+        long ones. Arm the event beforehand with `*OPC`. Other event bits (e.g.
+        command or query errors) do not end the wait.
+
+        Raises:
+            InstrumentCommunicationError: If *ESR? cannot be queried, or if the
+                OPC bit is not set within `timeout` seconds.
         """
         result = 0
-        max_attempts = 100
-        attempts = 0
-        while result == 0 and attempts < max_attempts:
+        interval = initial_interval
+        deadline = time.monotonic() + timeout
+        while True:
             try:
                 esr_response = self._backend.query("*ESR?") # Use self._backend
                 result = int(esr_response.strip())
             except Exception as e:
-                self._logger.debug(f"Error querying *ESR? during _wait_event: {e}")
+                self._logger.debug("Error querying *ESR? during _wait_event: %s", e)
                 raise InstrumentCommunicationError(
                     instrument=self.config.model,
                     command="*ESR?",
                     message="Failed to query *ESR? during wait.",
                 ) from e
-            time.sleep(0.1)
-            attempts += 1
+            if result & 1:
+                break
+            if time.monotonic() >= deadline:
+                self._logger.debug("_wait_event timed out polling *ESR? (last ESR: %d).", result)
+                raise InstrumentCommunicationError(
+                    instrument=self.config.model,
+                    command="*ESR?",
+                    message=f"Operation did not complete within {timeout} s.",
+                )
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
 
-        if attempts >= max_attempts and result == 0 :
-            self._logger.debug("Warning: _wait_event timed out polling *ESR?. ESR did not become non-zero.")
-        else:
-            self._logger.debug(f"Instrument event occurred or ESR became non-zero (ESR: {result}).")
+        self._logger.debug("Operation complete (ESR: %d).", result)
         self._command_log.append({"command": "*ESR? poll", "success": True, "type": "wait_event", "timestamp": time.time(), "final_esr": result})
 
 
@@ -1,9 +1,17 @@
 # tests/instruments/sim/test_oscilloscope_sim.py
 import pytest
+import numpy as np
+from io import BytesIO
+from PIL import Image
 import polars as pl
 from pytestlab.instruments import Oscilloscope
 from pytestlab.common.enums import TriggerSlope
-from pytestlab.errors import InstrumentCommunicationError
+from pytestlab.errors import (
+    InstrumentCommunicationError,
+    InstrumentConfigurationError,
+    InstrumentDataError,
+    InstrumentParameterError,
+)
 
 # Test file for oscilloscope simulation
 
@@ -60,6 +68,20 @@ def test_trigger_facade(sim_scope: Oscilloscope):
     assert float(level) == 1.23
     assert slope == "NEG"
 
+def test_configure_trigger_single_write(sim_scope: Oscilloscope, monkeypatch: pytest.MonkeyPatch):
+    """Verify that the trigger is set in one write, and only after every argument is valid."""
+    log_len = len(sim_scope._command_log)
+    sim_scope.configure_trigger(2, level=0.25, slope=TriggerSlope.NEGATIVE)
+    writes = [e["command"] for e in sim_scope._command_log[log_len:] if e["type"] == "write"]
+    assert writes == [":TRIG:SOUR CHANnel2;:TRIGger:LEVel 0.25, CHANnel2;:TRIGger:SLOPe NEG;:TRIGger:MODE EDGE"]
+
+    monkeypatch.setattr(sim_scope, "_trigger_slopes", frozenset({"POS"}))
+    log_len = len(sim_scope._command_log)
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.configure_trigger(1, level=0.5, slope=TriggerSlope.NEGATIVE)
+    assert exc_info.value.parameter == "slope"
+    assert len(sim_scope._command_log) == log_len
+
 def test_waveform_acquisition(sim_scope: Oscilloscope):
     """Verify that read_channels returns a correctly structured result."""
     sim_scope.get_sampling_rate = lambda: 1.0e9
@@ -75,6 +97,29 @@ def test_waveform_acquisition(sim_scope: Oscilloscope):
     assert result.values["Channel 1 (V)"].dtype == pl.Float64
     assert result.values["Channel 3 (V)"].dtype == pl.Float64
 
+    word = sim_scope.read_channels(1, waveform_format="WORD")
+    assert word.values.shape[0] == 512 # 1024 block bytes as 16-bit samples
+    assert any(
+        e["command"].startswith(":WAVeform:SOURce CHANnel1;:WAVeform:FORMat WORD;:WAVeform:BYTeorder LSBFirst")
+        for e in sim_scope._command_log[-10:]
+    )
+
+    short = sim_scope.read_channels(1, 2, points=256)
+    assert short.values.height == 256
+    assert any(
+        e["command"].endswith(":WAVeform:POINts:MODE RAW;:WAVeform:POINts 256")
+        for e in sim_scope._command_log[-12:]
+    )
+    assert sim_scope.read_channels(1, points=1024).values.height == 1024
+
+    reduced = sim_scope.read_channels(1, dtype="float32")
+    assert reduced.values["Time (s)"].dtype == pl.Float64
+    assert reduced.values["Channel 1 (V)"].dtype == pl.Float32
+
+    spectrum = sim_scope.read_fft_data(1, dtype="float32")
+    assert spectrum.values["Frequency (Hz)"].dtype == pl.Float64
+    assert spectrum.values["Magnitude (Linear)"].dtype == pl.Float32
+
 def test_error_generation(sim_scope: Oscilloscope):
     """Verify that the simulator generates an error based on the YAML rule."""
     sim_scope.clear_status() # Ensure error queue is empty
@@ -83,3 +128,266 @@ def test_error_generation(sim_scope: Oscilloscope):
     with pytest.raises(InstrumentCommunicationError) as exc_info:
         sim_scope.channel(1).setup(scale=0.0005)
     assert "Data out of range" in str(exc_info.value)
+
+def test_deferred_sync(sim_scope: Oscilloscope):
+    """Verify that setters inside deferred_sync() share a single *OPC? wait."""
+    def count_waits() -> int:
+        return sum(1 for entry in sim_scope._command_log if entry["type"] == "wait")
+
+    before = count_waits()
+    with sim_scope.deferred_sync():
+        for ch in (1, 2, 3):
+            sim_scope.set_channel_axis(ch, scale=0.2, offset=0.0)
+        sim_scope.set_time_axis(scale=1e-3, position=0.0)
+        assert count_waits() == before
+    assert count_waits() == before + 1
+
+    assert sim_scope.get_channel_axis(3)[0] == 0.2
+
+    # Outside the context every setter synchronises on its own again
+    sim_scope.set_time_axis(scale=1e-3, position=0.0)
+    assert count_waits() == before + 2
+
+def test_read_fft(sim_scope: Oscilloscope):
+    """Verify that read_fft scales the instrument's FFT waveform via its preamble."""
+    sim_scope.configure_fft(source_channel=1, window_type="HANNing", units="VRMS")
+    fft_writes = [e for e in sim_scope._command_log if e["type"] == "write" and e["command"].startswith(":FFT:")]
+    assert fft_writes[-1]["command"] == (
+        ":FFT:SOURce1 CHANnel1;:FFT:WINDow HANNing;:FFT:VTYPe VRMS;:FFT:DISPlay ON"
+    )
+    result = sim_scope.read_fft()
+
+    assert result.units == "V"
+    assert result.values.columns == ["Frequency (Hz)", "Magnitude (V)"]
+    assert result.values.height == 1024
+
+    freqs = result.values["Frequency (Hz)"].to_numpy()
+    assert freqs[0] == -5.12e-4 - 512 * 1.0e-6
+    assert np.allclose(np.diff(freqs), 1.0e-6)
+
+    linear = result.values["Magnitude (V)"].to_numpy()
+    in_db = sim_scope.read_fft(as_db=True)
+    assert in_db.units == "dBV"
+    with np.errstate(divide="ignore"):
+        assert np.allclose(in_db.values["Magnitude (dBV)"].to_numpy(), 20 * np.log10(linear), equal_nan=True)
+    db_spectrum = sim_scope.read_fft(as_array=True, as_db=True)
+    assert np.array_equal(db_spectrum[:, 1], in_db.values["Magnitude (dBV)"].to_numpy())
+
+    sim_scope.configure_fft(source_channel=1, window_type="HANNing", units="DECibel")
+    assert sim_scope.read_fft().units == "dBV"
+    assert sim_scope.read_fft(dtype="float32").values["Magnitude (dBV)"].dtype == pl.Float32
+
+    spectrum = sim_scope.read_fft(as_array=True)
+    assert spectrum.shape == (1024, 2)
+    assert np.array_equal(spectrum[:, 0], freqs)
+
+    log_len = len(sim_scope._command_log)
+    batch = sim_scope.read_fft_batch(3)
+    assert batch.values.columns == ["Frequency (Hz)", "Trace 1 (dBV)", "Trace 2 (dBV)", "Trace 3 (dBV)"]
+    assert batch.values.height == 1024
+    # Every trace is a fresh acquisition, synchronised before its transfer
+    batch_commands = [e["command"] for e in sim_scope._command_log[log_len:]]
+    assert batch_commands.count("DIGitize") == 3
+    assert batch_commands.count(":WAVeform:DATA?") == 3
+    last_digitize = len(batch_commands) - 1 - batch_commands[::-1].index("DIGitize")
+    assert "*OPC?" in batch_commands[last_digitize:]
+
+    # configure_fft writes the vertical type through, so it is never queried back
+    assert not any(e["command"] == ":FFT:VTYPe?" for e in sim_scope._command_log)
+
+def test_compound_commands(sim_scope: Oscilloscope):
+    """Verify that ';'-joined commands are applied in one write."""
+    sim_scope._send_commands([":CHANnel1:SCALe 0.5", ":CHANnel2:SCALe 0.25"])
+    assert sim_scope._query(":CHANnel1:SCALe?;:CHANnel2:SCALe?") == "0.5;0.25"
+
+    sim_scope.read_channels(1, 2)
+    setup_writes = [
+        entry["command"] for entry in sim_scope._command_log[-12:]
+        if entry["type"] == "write" and "WAVeform" in entry["command"]
+    ]
+    assert setup_writes == [
+        ":WAVeform:SOURce CHANnel1;:WAVeform:FORMat BYTE;:WAVeform:POINts:MODE RAW",
+        ":WAVeform:SOURce CHANnel2",
+    ]
+    # a single *OPC? per channel read
+    assert sum(1 for e in sim_scope._command_log[-12:] if e["type"] == "wait") == 2
+
+    # An unchanged transfer setup is not resent on the next read
+    log_len = len(sim_scope._command_log)
+    sim_scope.read_channels(1, 2)
+    setup_writes = [
+        entry["command"] for entry in sim_scope._command_log[log_len:]
+        if entry["type"] == "write" and "WAVeform" in entry["command"]
+    ]
+    assert setup_writes == [":WAVeform:SOURce CHANnel1", ":WAVeform:SOURce CHANnel2"]
+
+    sim_scope.display_channel([2, 3])
+    assert sim_scope._command_log[-1]["command"] == ":CHANnel2:DISPlay ON;:CHANnel3:DISPlay ON"
+    assert sim_scope._query(":CHANnel3:DISPlay?") == "1"
+    sim_scope.display_channel([2, 3], state=False)
+
+def test_invalid_channel_rejected(sim_scope: Oscilloscope):
+    """Verify that channel numbers outside the profile are rejected before any I/O."""
+    log_len = len(sim_scope._command_log)
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.set_channel_axis(5, scale=0.1, offset=0.0)
+    assert exc_info.value.parameter == "channel"
+    with pytest.raises(InstrumentParameterError):
+        sim_scope.set_probe_attenuation(0, 10)
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.display_channel([1, 2, 7])
+    assert exc_info.value.value == 7
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.channel(9)
+    assert exc_info.value.parameter == "ch_num"
+    with pytest.raises(InstrumentParameterError, match="Source channel number is out of range"):
+        sim_scope.configure_trigger(1, level=0.5, source="CH6")
+    assert len(sim_scope._command_log) == log_len
+
+def test_screenshot(sim_scope: Oscilloscope, monkeypatch: pytest.MonkeyPatch):
+    """Verify that the screenshot PNG is unwrapped from its binary block."""
+    buffer = BytesIO()
+    Image.new("RGB", (4, 3), "red").save(buffer, format="PNG")
+    png = buffer.getvalue()
+    monkeypatch.setattr(sim_scope, "_query_raw", lambda cmd: b"#8%08d%s\n" % (len(png), png))
+
+    image = sim_scope.screenshot()
+    assert image.size == (4, 3)
+
+    monkeypatch.setattr(sim_scope, "_query_raw", lambda cmd: b"#8%08d%s" % (len(png), png[:-10]))
+    with pytest.raises(InstrumentDataError, match="Truncated"):
+        sim_scope.screenshot()
+
+def test_wait_event(sim_scope: Oscilloscope):
+    """Verify that _wait_event returns as soon as *ESR? reports an event."""
+    sim_scope._wait_event(initial_interval=5.0)
+    entry = sim_scope._command_log[-1]
+    assert entry["type"] == "wait_event"
+    assert entry["final_esr"] == 1
+
+def test_wait_event_timeout(sim_scope: Oscilloscope, monkeypatch: pytest.MonkeyPatch):
+    """Verify that only the OPC bit ends the wait, and that a missed deadline raises."""
+    query = sim_scope._backend.query
+    # Command error bit set, OPC bit never set
+    monkeypatch.setattr(
+        sim_scope._backend, "query", lambda cmd, *args, **kwargs: "32" if cmd == "*ESR?" else query(cmd, *args, **kwargs)
+    )
+    with pytest.raises(InstrumentCommunicationError, match="did not complete"):
+        sim_scope._wait_event(initial_interval=0.001, timeout=0.02)
+
+    log_len = len(sim_scope._command_log)
+    with pytest.raises(InstrumentCommunicationError):
+        sim_scope.franalysis_sweep(1, 2, start_freq=1e3, stop_freq=1e5, amplitude=1.0, points=3, timeout=0.02)
+    # A sweep that never completed is not fetched, but the analysis is still disabled
+    commands = [e["command"] for e in sim_scope._command_log[log_len:]]
+    assert ":FRANalysis:DATA?" not in commands
+    assert commands.index(":FRANalysis:ENABle 0") > commands.index(":FRANalysis:RUN;*OPC")
+
+def test_truncated_binary_block_raises(sim_scope: Oscilloscope):
+    """Verify that a binary block shorter than its header declares is rejected."""
+    assert sim_scope._read_to_np(b"#15abcde\n").tolist() == list(b"abcde")
+    with pytest.raises(InstrumentDataError, match="Truncated"):
+        sim_scope._read_to_np(b"#15abc")
+    assert sim_scope._read_to_np(b"#14\x01\x00\x02\x01", dtype="<u2").tolist() == [1, 258]
+    with pytest.raises(InstrumentDataError, match="whole number"):
+        sim_scope._read_to_np(b"#13\x01\x00\x02", dtype="<u2")
+
+def test_headerless_data_uses_dtype(sim_scope: Oscilloscope):
+    """Verify that the non-block fallback decodes with the requested dtype."""
+    header = b"0123456789"
+    assert sim_scope._read_to_np(header + b"\x01\x00\x02\x01\n", dtype="<u2").tolist() == [1, 258]
+    with pytest.raises(InstrumentDataError, match="whole number"):
+        sim_scope._read_to_np(header + b"\x01\x00\x02", dtype="<u2")
+
+def test_preamble_cache(sim_scope: Oscilloscope):
+    """Verify that preambles are reused across reads until a configuring write."""
+    def count_preamble_queries() -> int:
+        return sum(1 for e in sim_scope._command_log if e["command"] == ":WAVeform:PREamble?")
+
+    sim_scope.set_time_axis(scale=1e-3, position=0.0)
+    sim_scope.read_channels(1, 2)
+    before = count_preamble_queries()
+    sim_scope.read_channels(1, 2)
+    assert count_preamble_queries() == before
+
+    sim_scope.set_channel_axis(2, scale=0.5, offset=0.0)
+    sim_scope.read_channels(1, 2)
+    assert count_preamble_queries() == before + 2
+
+    # A different digitized channel set can change the sample rate and record length
+    sim_scope.read_channels(1)
+    assert count_preamble_queries() == before + 3
+    # Nothing was reconfigured, so the two-channel preambles are still valid
+    sim_scope.read_channels(1, 2)
+    assert count_preamble_queries() == before + 3
+
+def test_read_preamble(sim_scope: Oscilloscope, monkeypatch: pytest.MonkeyPatch):
+    """Verify that the preamble is parsed field by field and malformed replies are rejected."""
+    pre = sim_scope._read_preamble()
+    assert (pre.format, pre.points, pre.xinc, pre.xref, pre.yref) == ("BYTE", 1024, 1.0e-6, 512.0, 128.0)
+
+    monkeypatch.setattr(sim_scope, "_query", lambda cmd: "0,0,1024,1")
+    with pytest.raises(InstrumentDataError, match="Malformed waveform preamble"):
+        sim_scope._read_preamble()
+
+def test_wgen_sin_single_write(sim_scope: Oscilloscope, monkeypatch: pytest.MonkeyPatch):
+    """Verify that set_wgen_sin sends its whole setup as one compound message."""
+    log_len = len(sim_scope._command_log)
+    sim_scope.set_wgen_sin(amp=1.0, offset=0.1, freq=1e3)
+    writes = [e["command"] for e in sim_scope._command_log[log_len:] if e["type"] == "write"]
+    assert writes == [
+        ":WGEN:FUNCtion SIN;:WGEN:VOLTage 1.0;:WGEN:VOLTage:OFFSet 0.1;:WGEN:FREQuency 1000.0"
+    ]
+
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.set_wgen_sin(amp=20.0, offset=0.0, freq=1e3)
+    assert exc_info.value.valid_range == (0, 9)
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.set_wgen_square(v0=0.0, v1=1.0, freq=0.01)
+    assert exc_info.value.parameter == "Waveform generator frequency"
+    with pytest.raises(InstrumentParameterError):
+        sim_scope.set_wgen_pulse(v0=0.0, v1=1.0, period=0.0, pulse_width=1e-6)
+
+    # A profile without a waveform generator rejects every wgen call up front
+    monkeypatch.setattr(sim_scope, "_has_wgen", False)
+    log_len = len(sim_scope._command_log)
+    with pytest.raises(InstrumentConfigurationError):
+        sim_scope.wave_gen(True)
+    with pytest.raises(InstrumentConfigurationError):
+        sim_scope.set_wgen_sin(amp=1.0, offset=0.1, freq=1e3)
+    assert len(sim_scope._command_log) == log_len
+
+def test_franalysis_sweep_validation(sim_scope: Oscilloscope):
+    """Verify that invalid sweep parameters are rejected before any command is sent."""
+    log_len = len(sim_scope._command_log)
+    sweep = dict(input_channel=1, output_channel=2, start_freq=1e3, stop_freq=1e5, amplitude=1.0)
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.franalysis_sweep(**{**sweep, "start_freq": 1e5, "stop_freq": 1e3})
+    assert exc_info.value.parameter == "stop_freq"
+    with pytest.raises(InstrumentParameterError):
+        sim_scope.franalysis_sweep(**sweep, points=5000)
+    with pytest.raises(InstrumentParameterError) as exc_info:
+        sim_scope.franalysis_sweep(**sweep, load="TENK")
+    assert exc_info.value.parameter == "load"
+    assert len(sim_scope._command_log) == log_len
+
+def test_franalysis_sweep(sim_scope: Oscilloscope, monkeypatch: pytest.MonkeyPatch):
+    """Verify that the sweep returns the fetched analysis data and disables afterwards."""
+    log_len = len(sim_scope._command_log)
+    result = sim_scope.franalysis_sweep(1, 2, start_freq=1e3, stop_freq=1e5, amplitude=1.0, points=3)
+    assert result.values.columns == ["Frequency (Hz)", "Amplitude (Vpp)", "Gain (dB)", "Phase (deg)"]
+    assert result.values["Gain (dB)"].to_list() == [-0.1, -3.0, -20.0]
+
+    commands = [e["command"] for e in sim_scope._command_log[log_len:]]
+    setup = next(c for c in commands if c.startswith(":FRANalysis:ENABle 1;"))
+    assert ":FRANalysis:SOURce:INPut CHANnel1;:FRANalysis:SOURce:OUTPut CHANnel2;" in setup
+    assert ":FRANalysis:RUN" not in setup
+    assert commands.index(setup) < commands.index(":FRANalysis:RUN;*OPC")
+    assert commands.index(":FRANalysis:ENABle 0") > commands.index(":FRANalysis:DATA?")
+
+    # Real instruments wrap the CSV in an IEEE 488.2 definite-length block
+    csv = b"Frequency (Hz),Gain (dB)\n1.0E+03,-0.1\n1.0E+04,-3.0\n"
+    monkeypatch.setattr(sim_scope, "_query_raw", lambda cmd: b"#2%d%s\n" % (len(csv), csv))
+    result = sim_scope.franalysis_sweep(1, 2, start_freq=1e3, stop_freq=1e4, amplitude=1.0, points=2)
+    assert result.values.schema == {"Frequency (Hz)": pl.Float64, "Gain (dB)": pl.Float64}
+    assert result.values["Frequency (Hz)"].to_list() == [1e3, 1e4]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from pytestlab.analysis.fft import compute_fft
+
+
+def _signal(n, dt=1e-3, dtype=np.float64):
+    t = np.arange(n) * dt
+    return t, np.sin(2 * np.pi * 50 * t).astype(dtype)
+
+
+@pytest.mark.parametrize("n", [1000, 1001])
+def test_compute_fft_returns_non_negative_bins(n):
+    """Tests that compute_fft returns the N // 2 + 1 rfft bins for even and odd N."""
+    t, v = _signal(n)
+    freqs, mags = compute_fft(t, v)
+    assert freqs.shape == mags.shape == (n // 2 + 1,)
+    assert freqs[0] == 0.0
+    assert np.allclose(freqs, np.fft.rfftfreq(n, d=1e-3))
+
+
+def test_compute_fft_frequencies_are_read_only():
+    """Tests that the shared, cached frequency array cannot be modified in place."""
+    t, v = _signal(256)
+    freqs, _ = compute_fft(t, v)
+    assert not freqs.flags.writeable
+    with pytest.raises(ValueError):
+        freqs[0] = 1.0
+    assert compute_fft(t, v)[0] is freqs
+
+
+def test_compute_fft_unknown_window():
+    """Tests that an unsupported window name raises ValueError."""
+    t, v = _signal(64)
+    with pytest.raises(ValueError, match="Unsupported window function"):
+        compute_fft(t, v, window="kaiser")
+
+
+@pytest.mark.parametrize("time_array", [np.zeros(64), np.arange(64)[::-1] * 1e-3])
+def test_compute_fft_unusable_time_axis(time_array):
+    """Tests that a zero or descending sample interval yields empty arrays."""
+    freqs, mags = compute_fft(time_array.astype(np.float64), np.ones(64))
+    assert freqs.size == 0 and mags.size == 0
+
+
+@pytest.mark.parametrize("window", ["hann", None])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_compute_fft_preserves_float_precision(window, dtype):
+    """Tests that float32 signals are transformed and returned in single precision."""
+    t, v = _signal(128, dtype=dtype)
+    _, mags = compute_fft(t, v, window=window)
+    assert mags.dtype == dtype